@@ -76,12 +76,20 @@ export default function Dashboard() {
     loadStores();
     fetchDashboardData();
 
-    // Update time every minute
-    const timer = setInterval(() => {
-      setCurrentTime(new Date());
-    }, 60000);
-
-    return () => clearInterval(timer);
+    // Update time on each minute boundary, sleeping until the next one
+    let timer;
+    const scheduleNextTick = () => {
+      const now = new Date();
+      const msUntilNextMinute =
+        60000 - (now.getSeconds() * 1000 + now.getMilliseconds());
+      timer = setTimeout(() => {
+        setCurrentTime(new Date());
+        scheduleNextTick();
+      }, msUntilNextMinute);
+    };
+    scheduleNextTick();
+
+    return () => clearTimeout(timer);
   }, []);
 
   // Refetch data when store selection changes
@@ -103,11 +103,6 @@ export const cleanupDatabase = async () => {
       "SELECT COUNT(*) as count FROM products",
     );
 
-    console.log("\n📊 Database Statistics:");
-    console.log(`- Stores: ${storeCount[0].count}`);
-    console.log(`- Products: ${productCount[0].count}`);
-    console.log(`- Transactions: ${transactionCount[0].count}`);
-
     // Check transaction distribution by type
     const [transactionTypes] = await query(`
       SELECT transaction_type, COUNT(*) as count 
@@ -116,12 +111,19 @@ export const cleanupDatabase = async () => {
       ORDER BY count DESC
     `);
 
-    console.log("\n📈 Transaction Types:");
-    transactionTypes.forEach((type) => {
-      console.log(`- ${type.transaction_type}: ${type.count}`);
-    });
-
-    console.log("\n✅ Database cleanup completed!");
+    // Emit the report as a single write rather than one log line per row
+    const report = [
+      "\n📊 Database Statistics:",
+      `- Stores: ${storeCount[0].count}`,
+      `- Products: ${productCount[0].count}`,
+      `- Transactions: ${transactionCount[0].count}`,
+      "\n📈 Transaction Types:",
+      ...transactionTypes.map(
+        (type) => `- ${type.transaction_type}: ${type.count}`,
+      ),
+      "\n✅ Database cleanup completed!",
+    ];
+    console.log(report.join("\n"));
     return true;
   } catch (error) {
     console.error("❌ Database cleanup failed:", error);
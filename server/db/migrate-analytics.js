@@ -1,7 +1,7 @@
 import { readFileSync } from "fs";
 import { join, dirname } from "path";
 import { fileURLToPath } from "url";
-import { query } from "./sqlite.js";
+import { query, exec } from "./sqlite.js";
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 
@@ -15,15 +15,12 @@ async function runMigrations() {
       "utf8",
     );
 
-    // Split by semicolon and execute each statement
-    const statements = migrationSQL
-      .split(";")
-      .map((stmt) => stmt.trim())
-      .filter((stmt) => stmt.length > 0);
-
-    for (const statement of statements) {
-      console.log("Executing:", statement.substring(0, 50) + "...");
-      await query(statement);
+    // Execute the whole script as one batch inside a single transaction
+    try {
+      await exec(`BEGIN;\n${migrationSQL}\nCOMMIT;`);
+    } catch (error) {
+      await exec("ROLLBACK;").catch(() => {});
+      throw error;
     }
 
     console.log("✅ Product analytics migration completed successfully!");
@@ -32,6 +32,16 @@ const dbAll = (sql, params = []) => {
   });
 };
 
+// Run a multi-statement SQL script in a single call
+const dbExec = (sql) => {
+  return new Promise((resolve, reject) => {
+    db.exec(sql, (err) => {
+      if (err) reject(err);
+      else resolve();
+    });
+  });
+};
+
 // Initialize database with tables and sample data
 export const initializeDatabase = async () => {
   try {
@@ -300,8 +310,11 @@ export const query = async (sql, params = []) => {
   }
 };
 
+export const exec = dbExec;
+
 export default {
   query,
+  exec: dbExec,
   get: dbGet,
   all: dbAll,
   run: dbRun,
@@ -28,6 +28,7 @@ import {
   getStores as getForecastingStores,
   getProducts as getForecastingProducts,
   getCategoryInsights,
+  invalidateDemandPredictionsCache,
 } from "./routes/forecasting.js";
 import { generateForecast as generateForecastProxy } from "./routes/aws-proxy.js";
 import {
@@ -68,13 +69,35 @@ const dbConfig = {
   },
 };
 
-// Create RDS connection pool
+// Create RDS connection pool. Routes query through pool.execute(), which
+// prepares each distinct statement once per connection and reuses the
+// server-side handle afterwards
 const pool = mysql.createPool({
   ...dbConfig,
   waitForConnections: true,
   connectionLimit: 10,
   queueLimit: 0,
 });
+
+// Static /api/ping body, serialized once at startup
+const PING_RESPONSE = JSON.stringify({
+  message: "Hello from Express server v2!",
+});
+
+// Multi-row inserts are written in chunks so no single prepared statement
+// comes near MySQL's 65,535 placeholder limit
+const INSERT_CHUNK_ROWS = 500;
+const insertRowsInChunks = async (db, insertSql, rows) => {
+  if (rows.length === 0) return;
+  const rowPlaceholders = `(${rows[0].map(() => "?").join(", ")})`;
+  for (let start = 0; start < rows.length; start += INSERT_CHUNK_ROWS) {
+    const chunk = rows.slice(start, start + INSERT_CHUNK_ROWS);
+    await db.execute(
+      `${insertSql} VALUES ${chunk.map(() => rowPlaceholders).join(", ")}`,
+      chunk.flat(),
+    );
+  }
+};
 //
 // RDS Health Check Function
 const checkRDSConnection = async () => {
@@ -121,7 +144,7 @@ export function createServer() {
 
   // Example API routes
   app.get("/api/ping", (_req, res) => {
-    res.json({ message: "Hello from Express server v2!" });
+    res.type("json").send(PING_RESPONSE);
   });
 
   // AWS RDS Health Check endpoint
@@ -327,17 +350,18 @@ export function createServer() {
   // AWS RDS Inventory Analytics
   app.get("/api/analytics/inventory-db", async (req, res) => {
     try {
-      const [lowStockItems] = await req.db.execute(
-        "SELECT * FROM products WHERE quantity <= minimum_stock ORDER BY quantity ASC",
-      );
-
-      const [totalProducts] = await req.db.execute(
-        'SELECT COUNT(*) as total FROM products WHERE status = "active"',
-      );
-
-      const [totalValue] = await req.db.execute(
-        'SELECT SUM(price * quantity) as total_value FROM products WHERE status = "active"',
-      );
+      const [[lowStockItems], [totalProducts], [totalValue]] =
+        await Promise.all([
+          req.db.execute(
+            "SELECT * FROM products WHERE quantity <= minimum_stock ORDER BY quantity ASC",
+          ),
+          req.db.execute(
+            'SELECT COUNT(*) as total FROM products WHERE status = "active"',
+          ),
+          req.db.execute(
+            'SELECT SUM(price * quantity) as total_value FROM products WHERE status = "active"',
+          ),
+        ]);
 
       res.json({
         lowStockItems,
@@ -389,22 +413,26 @@ export function createServer() {
         },
       ];
 
-      for (const model of models) {
-        await req.db.execute(
-          `INSERT IGNORE INTO demand_forecasting_models
-           (model_name, model_type, sagemaker_endpoint, model_accuracy, training_status, store_id, category_id)
-           VALUES (?, ?, ?, ?, ?, ?, ?)`,
-          [
-            model.name,
-            model.type,
-            model.endpoint,
-            model.accuracy,
-            model.status,
-            model.store_id,
-            model.category_id,
-          ],
-        );
-      }
+      await req.db.execute(
+        `INSERT IGNORE INTO demand_forecasting_models
+         (model_name, model_type, sagemaker_endpoint, model_accuracy, training_status, store_id, category_id)
+         VALUES ${models.map(() => "(?, ?, ?, ?, ?, ?, ?)").join(", ")}`,
+        models.flatMap((model) => [
+          model.name,
+          model.type,
+          model.endpoint,
+          model.accuracy,
+          model.status,
+          model.store_id,
+          model.category_id,
+        ]),
+      );
+
+      // One clock reading for the whole run keeps every row on the same day
+      const dayMs = 24 * 60 * 60 * 1000;
+      const now = Date.now();
+      const analysisDate = new Date(now).toISOString().split("T")[0];
+      const expiresAt = new Date(now + 30 * dayMs).toISOString().split("T")[0];
 
       // 2. Generate demand predictions for next 30 days
       const [products] = await req.db.execute(
@@ -414,88 +442,92 @@ export function createServer() {
         "SELECT id FROM demand_forecasting_models",
       );
 
+      const predictionRows = [];
       for (const product of products) {
         for (let days = 1; days <= 30; days++) {
-          const predictionDate = new Date();
-          predictionDate.setDate(predictionDate.getDate() + days);
+          const predictionDate = new Date(now + days * dayMs);
 
           const basedemand = 20 + Math.random() * 50;
           const seasonalFactor = 1 + 0.3 * Math.sin((days / 7) * Math.PI);
           const predictedDemand = Math.round(basedemand * seasonalFactor);
 
-          await req.db.execute(
-            `INSERT IGNORE INTO demand_predictions
-             (product_id, store_id, model_id, prediction_date, predicted_demand,
-              confidence_interval_lower, confidence_interval_upper, factors, lambda_execution_id)
-             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-            [
-              product.id,
-              product.store_id,
-              modelIds[Math.floor(Math.random() * modelIds.length)].id,
-              predictionDate.toISOString().split("T")[0],
-              predictedDemand,
-              Math.round(predictedDemand * 0.8),
-              Math.round(predictedDemand * 1.2),
-              JSON.stringify({
-                seasonality: "weekly",
-                weatherImpact: "minimal",
-                promotions: Math.random() > 0.8 ? "active" : "none",
-              }),
-              `lambda-exec-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`,
-            ],
-          );
+          predictionRows.push([
+            product.id,
+            product.store_id,
+            modelIds[Math.floor(Math.random() * modelIds.length)].id,
+            predictionDate.toISOString().split("T")[0],
+            predictedDemand,
+            Math.round(predictedDemand * 0.8),
+            Math.round(predictedDemand * 1.2),
+            JSON.stringify({
+              seasonality: "weekly",
+              weatherImpact: "minimal",
+              promotions: Math.random() > 0.8 ? "active" : "none",
+            }),
+            `lambda-exec-${now}-${Math.random().toString(36).substr(2, 9)}`,
+          ]);
         }
       }
 
+      // Multi-row inserts instead of a round trip per prediction
+      await insertRowsInChunks(
+        req.db,
+        `INSERT IGNORE INTO demand_predictions
+         (product_id, store_id, model_id, prediction_date, predicted_demand,
+          confidence_interval_lower, confidence_interval_upper, factors, lambda_execution_id)`,
+        predictionRows,
+      );
+      invalidateDemandPredictionsCache();
+
       // 3. Generate inventory optimization recommendations
-      for (const product of products) {
+      const optimizationRows = products.map((product) => {
         const currentStock = 50 + Math.random() * 200;
         const recommendedStock = currentStock + (Math.random() * 40 - 20);
         const reorderPoint = Math.round(currentStock * 0.3);
 
-        await req.db.execute(
-          `INSERT IGNORE INTO inventory_optimization
-           (product_id, store_id, current_stock, recommended_stock, reorder_point,
-            optimal_order_quantity, safety_stock, stockout_probability, excess_inventory_risk,
-            cost_optimization_score, recommendation_type, reasoning, implementation_priority,
-            estimated_cost_savings, lambda_function_version, analysis_date, expires_at)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-          [
-            product.id,
-            product.store_id,
-            Math.round(currentStock),
-            Math.round(recommendedStock),
-            reorderPoint,
-            Math.round(recommendedStock * 0.6),
-            Math.round(reorderPoint * 0.5),
-            (Math.random() * 0.15).toFixed(2),
-            (Math.random() * 0.25).toFixed(2),
-            (Math.random() * 1000).toFixed(2),
-            recommendedStock > currentStock
-              ? "increase"
-              : recommendedStock < currentStock
-                ? "decrease"
-                : "maintain",
-            JSON.stringify({
-              demandTrend: Math.random() > 0.5 ? "increasing" : "stable",
-              seasonalFactor: "moderate",
-              supplierReliability: "high",
-              storageCost: "low",
-            }),
-            Math.random() > 0.6
-              ? "high"
-              : Math.random() > 0.3
-                ? "medium"
-                : "low",
-            (Math.random() * 500).toFixed(2),
-            "lambda-inv-opt-v1.2",
-            new Date().toISOString().split("T")[0],
-            new Date(Date.now() + 30 * 24 * 60 * 60 * 1000)
-              .toISOString()
-              .split("T")[0],
-          ],
-        );
-      }
+        return [
+          product.id,
+          product.store_id,
+          Math.round(currentStock),
+          Math.round(recommendedStock),
+          reorderPoint,
+          Math.round(recommendedStock * 0.6),
+          Math.round(reorderPoint * 0.5),
+          (Math.random() * 0.15).toFixed(2),
+          (Math.random() * 0.25).toFixed(2),
+          (Math.random() * 1000).toFixed(2),
+          recommendedStock > currentStock
+            ? "increase"
+            : recommendedStock < currentStock
+              ? "decrease"
+              : "maintain",
+          JSON.stringify({
+            demandTrend: Math.random() > 0.5 ? "increasing" : "stable",
+            seasonalFactor: "moderate",
+            supplierReliability: "high",
+            storageCost: "low",
+          }),
+          Math.random() > 0.6
+            ? "high"
+            : Math.random() > 0.3
+              ? "medium"
+              : "low",
+          (Math.random() * 500).toFixed(2),
+          "lambda-inv-opt-v1.2",
+          analysisDate,
+          expiresAt,
+        ];
+      });
+
+      await insertRowsInChunks(
+        req.db,
+        `INSERT IGNORE INTO inventory_optimization
+         (product_id, store_id, current_stock, recommended_stock, reorder_point,
+          optimal_order_quantity, safety_stock, stockout_probability, excess_inventory_risk,
+          cost_optimization_score, recommendation_type, reasoning, implementation_priority,
+          estimated_cost_savings, lambda_function_version, analysis_date, expires_at)`,
+        optimizationRows,
+      );
 
       res.json({
         message: "AI Analytics sample data generated successfully",
@@ -554,23 +586,26 @@ export function createServer() {
         ["Personal Care", "Health and beauty products"],
       ];
 
-      for (const [name, description] of categories) {
-        await req.db.execute(
-          "INSERT IGNORE INTO categories (name, description) VALUES (?, ?)",
-          [name, description],
-        );
-      }
+      await req.db.execute(
+        `INSERT IGNORE INTO categories (name, description) VALUES ${categories
+          .map(() => "(?, ?)")
+          .join(", ")}`,
+        categories.flat(),
+      );
 
       // Add category_id column to products table if it doesn't exist
-      try {
+      const [categoryColumn] = await req.db.execute(
+        `SELECT 1 FROM information_schema.COLUMNS
+         WHERE TABLE_SCHEMA = DATABASE()
+           AND TABLE_NAME = 'products'
+           AND COLUMN_NAME = 'category_id'`,
+      );
+      if (categoryColumn.length === 0) {
         await req.db.execute(`
           ALTER TABLE products
           ADD COLUMN category_id INT,
           ADD FOREIGN KEY (category_id) REFERENCES categories(id)
         `);
-      } catch (error) {
-        // Column might already exist, ignore error
-        console.log("Category_id column might already exist:", error.message);
       }
 
       // Update existing products to use category_id
@@ -585,14 +620,15 @@ export function createServer() {
         Grains: 8,
       };
 
-      for (const [categoryName, categoryId] of Object.entries(
-        categoryMapping,
-      )) {
-        await req.db.execute(
-          "UPDATE products SET category_id = ? WHERE category = ?",
-          [categoryId, categoryName],
-        );
-      }
+      const categoryEntries = Object.entries(categoryMapping);
+      await req.db.execute(
+        `UPDATE products
+         SET category_id = CASE category ${categoryEntries
+           .map(() => "WHEN ? THEN ?")
+           .join(" ")} END
+         WHERE category IN (${categoryEntries.map(() => "?").join(", ")})`,
+        [...categoryEntries.flat(), ...categoryEntries.map(([name]) => name)],
+      );
 
       // Create AI Analytics tables for Lambda and SageMaker integration
 
@@ -49,11 +49,14 @@ export const getTopSellingCategories = async (req, res) => {
       params.push(storeId);
     }
 
+    // LIMIT is bound as a string: mysql2 sends JS numbers as DOUBLE, which
+    // MySQL rejects for LIMIT in prepared statements
     sql += `
       GROUP BY category
       ORDER BY total_revenue DESC
-      LIMIT ${parseInt(limit)}
+      LIMIT ?
     `;
+    params.push(String(parseInt(limit) || 5));
 
     const [rows] = await req.db.execute(sql, params);
 
@@ -187,6 +190,10 @@ export const getDashboardAnalytics = async (req, res) => {
   try {
     const { storeId } = req.query;
 
+    // Every query below shares the same optional store filter
+    const filterByStore = storeId && storeId !== "all";
+    const storeParams = filterByStore ? [storeId] : [];
+
     // Get basic inventory data
     let inventorySql = `
       SELECT
@@ -198,14 +205,10 @@ export const getDashboardAnalytics = async (req, res) => {
       WHERE status = 'active'
     `;
 
-    const inventoryParams = [];
-    if (storeId && storeId !== "all") {
+    if (filterByStore) {
       inventorySql += " AND store_id = ?";
-      inventoryParams.push(storeId);
     }
 
-    const [inventoryData] = await req.db.execute(inventorySql, inventoryParams);
-
     // Get top selling categories
     let categorySql = `
       SELECT
@@ -216,10 +219,8 @@ export const getDashboardAnalytics = async (req, res) => {
       WHERE transaction_type = 'sale'
     `;
 
-    const categoryParams = [];
-    if (storeId && storeId !== "all") {
+    if (filterByStore) {
       categorySql += " AND store_id = ?";
-      categoryParams.push(storeId);
     }
 
     categorySql += `
@@ -228,52 +229,43 @@ export const getDashboardAnalytics = async (req, res) => {
       LIMIT 5
     `;
 
-    const [categoryData] = await req.db.execute(categorySql, categoryParams);
-
-    // Get monthly revenue
-    let revenueSql = `
+    // Monthly revenue and 30-day units sold (for a simplified inventory
+    // turnover) come from one scan of the sales rows covering both windows
+    let salesSql = `
       SELECT
-        SUM(total_amount) as monthly_revenue
+        SUM(CASE WHEN created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
+                 THEN total_amount END) as monthly_revenue,
+        SUM(CASE WHEN created_at >= DATE_SUB(NOW(), INTERVAL 30 DAY)
+                 THEN ABS(quantity) END) as total_sold
       FROM inventory_transactions
       WHERE transaction_type = 'sale'
-                AND created_at >= DATE_FORMAT(NOW(), '%Y-%m-01')
+                AND created_at >= LEAST(
+                  CAST(DATE_FORMAT(NOW(), '%Y-%m-01') AS DATETIME),
+                  DATE_SUB(NOW(), INTERVAL 30 DAY)
+                )
     `;
 
-    const revenueParams = [];
-    if (storeId && storeId !== "all") {
-      revenueSql += " AND store_id = ?";
-      revenueParams.push(storeId);
-    }
-
-    const [revenueData] = await req.db.execute(revenueSql, revenueParams);
-
-    // Calculate inventory turnover (simplified)
-    let turnoverSql = `
-      SELECT
-        SUM(ABS(quantity)) as total_sold
-      FROM inventory_transactions
-      WHERE transaction_type = 'sale'
-                AND created_at >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-    `;
-
-    const turnoverParams = [];
-    if (storeId && storeId !== "all") {
-      turnoverSql += " AND store_id = ?";
-      turnoverParams.push(storeId);
+    if (filterByStore) {
+      salesSql += " AND store_id = ?";
     }
 
-    const [turnoverData] = await req.db.execute(turnoverSql, turnoverParams);
+    // The queries are independent, so issue them concurrently on the pool
+    const [[inventoryData], [categoryData], [salesData]] = await Promise.all([
+      req.db.execute(inventorySql, storeParams),
+      req.db.execute(categorySql, storeParams),
+      req.db.execute(salesSql, storeParams),
+    ]);
 
     const inventory = inventoryData[0] || {};
     const totalStock = inventory.total_stock || 1;
-    const totalSold = turnoverData[0]?.total_sold || 0;
+    const totalSold = salesData[0]?.total_sold || 0;
     const inventoryTurnover = (totalSold / totalStock) * 12; // Annualized
 
     // Format response
     const dashboardData = {
       totalProducts: inventory.total_products || 0,
       lowStockItems: inventory.low_stock_items || 0,
-      revenueThisMonth: parseFloat(revenueData[0]?.monthly_revenue || 0),
+      revenueThisMonth: parseFloat(salesData[0]?.monthly_revenue || 0),
       inventoryTurnover: Math.round(inventoryTurnover * 100) / 100,
       topSellingCategories: categoryData.map((cat) => ({
         name: cat.category,
@@ -6,6 +6,20 @@
 //   region: process.env.AWS_REGION || 'us-east-1'
 // });
 
+// Demo analytics data that would come from Lambda; only the timestamp
+// changes between requests, so build it once
+const DEMO_ANALYTICS = Object.freeze({
+  totalProducts: 1250,
+  lowStockItems: 23,
+  topSellingCategories: [
+    { name: "Beverages", sales: 850 },
+    { name: "Snacks", sales: 720 },
+    { name: "Dairy", sales: 650 },
+  ],
+  revenueThisMonth: 45230.5,
+  inventoryTurnover: 4.2,
+});
+
 export const handleDemo = async (req, res) => {
   try {
     // AWS Lambda Function Invocation Example with Transaction Analytics
@@ -54,18 +68,7 @@ export const handleDemo = async (req, res) => {
     const response = {
       message: "Hello from Express server",
       timestamp: new Date().toISOString(),
-      // Demo analytics data that would come from Lambda
-      analytics: {
-        totalProducts: 1250,
-        lowStockItems: 23,
-        topSellingCategories: [
-          { name: "Beverages", sales: 850 },
-          { name: "Snacks", sales: 720 },
-          { name: "Dairy", sales: 650 },
-        ],
-        revenueThisMonth: 45230.5,
-        inventoryTurnover: 4.2,
-      },
+      analytics: DEMO_ANALYTICS,
     };
 
     res.status(200).json(response);
@@ -1,5 +1,16 @@
 import { createApiResponse, createApiError } from "../../shared/api.js";
 
+// Predictions are written in batches and read far more often than they
+// change, so recent results are served from memory for a short while
+const PREDICTIONS_CACHE_TTL_MS = 60 * 1000;
+const PREDICTIONS_CACHE_MAX_ENTRIES = 500;
+const predictionsCache = new Map();
+
+// Drop cached predictions after new rows have been written
+export const invalidateDemandPredictionsCache = () => {
+  predictionsCache.clear();
+};
+
 // Get demand predictions from real database
 export const getDemandPredictions = async (req, res) => {
   try {
@@ -22,7 +33,6 @@ export const getDemandPredictions = async (req, res) => {
         dp.confidence_interval_upper,
         dp.actual_demand,
         dp.prediction_accuracy,
-        dp.factors,
         dp.lambda_execution_id,
         dp.created_at,
         p.name as product_name,
@@ -55,14 +65,31 @@ export const getDemandPredictions = async (req, res) => {
     query += " ORDER BY dp.prediction_date ASC, dp.predicted_demand DESC";
     query += " LIMIT 100"; // Limit for performance
 
-    const [rows] = await req.db.execute(query, params);
+    // The date range is part of the key, so entries roll over at midnight
+    const cacheKey = [
+      params[0],
+      params[1],
+      store_id || "all",
+      product_id || "",
+    ].join("|");
+    const cached = predictionsCache.get(cacheKey);
+    let predictions;
 
-    // Parse JSON factors field
-    const predictions = rows.map((row) => ({
-      ...row,
-      factors:
-        typeof row.factors === "string" ? JSON.parse(row.factors) : row.factors,
-    }));
+    if (cached && Date.now() < cached.expiresAt) {
+      predictions = cached.predictions;
+    } else {
+      // The factors JSON blob is left out: the forecasting page only reads the
+      // scalar columns, so there is nothing to ship back or re-parse per row
+      [predictions] = await req.db.execute(query, params);
+
+      if (predictionsCache.size >= PREDICTIONS_CACHE_MAX_ENTRIES) {
+        predictionsCache.clear();
+      }
+      predictionsCache.set(cacheKey, {
+        expiresAt: Date.now() + PREDICTIONS_CACHE_TTL_MS,
+        predictions,
+      });
+    }
 
     res.json(
       createApiResponse(
@@ -110,15 +137,75 @@ export const getCategoryInsights = async (req, res) => {
 // Get forecasting dashboard summary from real database
 export const getForecastingDashboard = async (req, res) => {
   try {
-    // Get basic prediction statistics
-    const [summaryResult] = await req.db.execute(`
-      SELECT
-        1 as totalModels,
-        AVG(dp.prediction_accuracy) as avgAccuracy,
-        COUNT(dp.id) as totalPredictions
-      FROM demand_predictions dp
-      WHERE dp.prediction_date >= CURDATE()
-    `);
+    // These queries are independent, so issue them concurrently on the pool
+    const [
+      [summaryResult],
+      [highPriorityResult],
+      [recentPredictions],
+      [categoryPerformance],
+      [accuracyTrends],
+    ] = await Promise.all([
+      // Get basic prediction statistics
+      req.db.execute(`
+        SELECT
+          1 as totalModels,
+          AVG(dp.prediction_accuracy) as avgAccuracy,
+          COUNT(dp.id) as totalPredictions
+        FROM demand_predictions dp
+        WHERE dp.prediction_date >= CURDATE()
+      `),
+      // Get high priority recommendations (predictions with high demand variance)
+      req.db.execute(`
+        SELECT COUNT(*) as count
+        FROM demand_predictions dp
+        WHERE dp.prediction_date >= CURDATE()
+        AND (dp.confidence_interval_upper - dp.confidence_interval_lower) > dp.predicted_demand * 0.5
+      `),
+      // Get top predicted products for next 7 days
+      req.db.execute(`
+        SELECT
+          p.name as product_name,
+          dp.product_id,
+          s.name as store_name,
+          SUM(dp.predicted_demand) as total_predicted_demand,
+          AVG(dp.predicted_demand) as avg_daily_demand
+        FROM demand_predictions dp
+        JOIN products p ON dp.product_id = p.id
+        JOIN stores s ON dp.store_id = s.id
+        WHERE dp.prediction_date BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL 7 DAY)
+        GROUP BY dp.product_id, dp.store_id
+        ORDER BY total_predicted_demand DESC
+        LIMIT 10
+      `),
+      // Get category performance data
+      req.db.execute(`
+        SELECT
+          p.category,
+          COUNT(DISTINCT dp.product_id) as product_count,
+          COUNT(dp.id) as prediction_count,
+          AVG(dp.predicted_demand) as avg_predicted_demand,
+          AVG(dp.prediction_accuracy) as avg_accuracy,
+          AVG(dp.confidence_interval_upper - dp.confidence_interval_lower) as avg_uncertainty
+        FROM demand_predictions dp
+        JOIN products p ON dp.product_id = p.id
+        WHERE dp.prediction_date >= CURDATE()
+        GROUP BY p.category
+        ORDER BY avg_predicted_demand DESC
+      `),
+      // Get accuracy trends and insights
+      req.db.execute(`
+        SELECT
+          DATE(dp.created_at) as date,
+          AVG(dp.prediction_accuracy) as avg_accuracy,
+          COUNT(*) as prediction_count
+        FROM demand_predictions dp
+        WHERE dp.created_at >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
+        AND dp.prediction_accuracy IS NOT NULL
+        GROUP BY DATE(dp.created_at)
+        ORDER BY date DESC
+        LIMIT 7
+      `),
+    ]);
 
     const summary = summaryResult[0] || {
       totalModels: 1,
@@ -126,63 +213,8 @@ export const getForecastingDashboard = async (req, res) => {
       totalPredictions: 0,
     };
 
-    // Get high priority recommendations (predictions with high demand variance)
-    const [highPriorityResult] = await req.db.execute(`
-      SELECT COUNT(*) as count
-      FROM demand_predictions dp
-      WHERE dp.prediction_date >= CURDATE()
-      AND (dp.confidence_interval_upper - dp.confidence_interval_lower) > dp.predicted_demand * 0.5
-    `);
-
     const highPriorityRecommendations = highPriorityResult[0]?.count || 0;
 
-    // Get top predicted products for next 7 days
-    const [recentPredictions] = await req.db.execute(`
-      SELECT
-        p.name as product_name,
-        dp.product_id,
-        s.name as store_name,
-        SUM(dp.predicted_demand) as total_predicted_demand,
-        AVG(dp.predicted_demand) as avg_daily_demand
-      FROM demand_predictions dp
-      JOIN products p ON dp.product_id = p.id
-      JOIN stores s ON dp.store_id = s.id
-      WHERE dp.prediction_date BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL 7 DAY)
-      GROUP BY dp.product_id, dp.store_id
-      ORDER BY total_predicted_demand DESC
-      LIMIT 10
-    `);
-
-    // Get category performance data
-    const [categoryPerformance] = await req.db.execute(`
-      SELECT
-        p.category,
-        COUNT(DISTINCT dp.product_id) as product_count,
-        COUNT(dp.id) as prediction_count,
-        AVG(dp.predicted_demand) as avg_predicted_demand,
-        AVG(dp.prediction_accuracy) as avg_accuracy,
-        AVG(dp.confidence_interval_upper - dp.confidence_interval_lower) as avg_uncertainty
-      FROM demand_predictions dp
-      JOIN products p ON dp.product_id = p.id
-      WHERE dp.prediction_date >= CURDATE()
-      GROUP BY p.category
-      ORDER BY avg_predicted_demand DESC
-    `);
-
-    // Get accuracy trends and insights
-    const [accuracyTrends] = await req.db.execute(`
-      SELECT
-        DATE(dp.created_at) as date,
-        AVG(dp.prediction_accuracy) as avg_accuracy,
-        COUNT(*) as prediction_count
-      FROM demand_predictions dp
-      WHERE dp.created_at >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
-      AND dp.prediction_accuracy IS NOT NULL
-      GROUP BY DATE(dp.created_at)
-      ORDER BY date DESC
-      LIMIT 7
-    `);
-
     const dashboardData = {
       summary: {
         ...summary,
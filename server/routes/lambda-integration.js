@@ -221,35 +221,50 @@ export const handleTransactionProcessor = async (req, res) => {
 };
 
 // Health Check for Lambda Functions
-export const handleLambdaHealthCheck = async (req, res) => {
-  try {
-    const functions = [
-      "invencare-inventory-analytics",
-      "invencare-transaction-analytics",
-      "invencare-auto-reorder",
-      "invencare-transaction-processor",
-    ];
+// Health probes invoke every function, so results are reused for 30s;
+// concurrent polls inside that window share the same in-flight probe
+const HEALTH_CHECK_TTL_MS = 30 * 1000;
+let cachedHealthCheck = null;
 
-    const healthChecks = await Promise.allSettled(
-      functions.map(async (functionName) => {
-        try {
-          const result = await invokeLambda(functionName, {
-            action: "healthcheck",
-          });
-          return { functionName, status: "healthy", result };
-        } catch (error) {
-          return { functionName, status: "unhealthy", error: error.message };
-        }
-      }),
-    );
+const runLambdaHealthChecks = async () => {
+  const functions = [
+    "invencare-inventory-analytics",
+    "invencare-transaction-analytics",
+    "invencare-auto-reorder",
+    "invencare-transaction-processor",
+  ];
 
-    const healthStatus = {
-      overall: healthChecks.every((check) => check.value?.status === "healthy")
-        ? "healthy"
-        : "degraded",
-      functions: healthChecks.map((check) => check.value),
-      timestamp: new Date().toISOString(),
-    };
+  const healthChecks = await Promise.allSettled(
+    functions.map(async (functionName) => {
+      try {
+        const result = await invokeLambda(functionName, {
+          action: "healthcheck",
+        });
+        return { functionName, status: "healthy", result };
+      } catch (error) {
+        return { functionName, status: "unhealthy", error: error.message };
+      }
+    }),
+  );
+
+  return {
+    overall: healthChecks.every((check) => check.value?.status === "healthy")
+      ? "healthy"
+      : "degraded",
+    functions: healthChecks.map((check) => check.value),
+    timestamp: new Date().toISOString(),
+  };
+};
+
+export const handleLambdaHealthCheck = async (req, res) => {
+  try {
+    if (!cachedHealthCheck || Date.now() >= cachedHealthCheck.expiresAt) {
+      cachedHealthCheck = {
+        expiresAt: Date.now() + HEALTH_CHECK_TTL_MS,
+        status: runLambdaHealthChecks(),
+      };
+    }
+    const healthStatus = await cachedHealthCheck.status;
 
     res
       .status(200)
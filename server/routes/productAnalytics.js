@@ -99,17 +99,15 @@ export const getProductSalesTrends = async (req, res) => {
     const { productId, storeId } = req.params;
     const { days = 30 } = req.query;
 
-    const startDate = new Date();
-    startDate.setDate(startDate.getDate() - parseInt(days));
+    const dayCount = parseInt(days);
+    const dayMs = 24 * 60 * 60 * 1000;
+    const startTime = Date.now() - dayCount * dayMs;
 
     // This is a mock implementation - in production, you'd query the product_sales_trends table
     const trends = [];
-    for (let i = 0; i < parseInt(days); i++) {
-      const date = new Date(startDate);
-      date.setDate(date.getDate() + i);
-
+    for (let i = 0; i < dayCount; i++) {
       trends.push({
-        date: date.toISOString().split("T")[0],
+        date: new Date(startTime + i * dayMs).toISOString().slice(0, 10),
         unitsSold: Math.floor(Math.random() * 20),
         revenue: Math.floor(Math.random() * 500),
         averagePrice: 15.99 + Math.random() * 10,
@@ -144,25 +142,29 @@ export const generateStoreAnalytics = async (req, res) => {
     const { storeId } = req.params;
 
     // Get all products in the store
-    const [products] = await req.db.query(
+    const [products] = await req.db.execute(
       "SELECT id FROM products WHERE store_id = ?",
       [storeId],
     );
 
-    const analytics = [];
-    for (const product of products) {
-      try {
-        const performance =
-          await ProductAnalyticsService.calculateProductPerformance(
-            product.id,
-            storeId,
-            30,
+    // Products are independent, so calculate them concurrently; a failure
+    // only drops that product from the results
+    const results = await Promise.all(
+      products.map((product) =>
+        ProductAnalyticsService.calculateProductPerformance(
+          product.id,
+          storeId,
+          30,
+        ).catch((error) => {
+          console.error(
+            `Error calculating analytics for ${product.id}:`,
+            error,
           );
-        analytics.push(performance);
-      } catch (error) {
-        console.error(`Error calculating analytics for ${product.id}:`, error);
-      }
-    }
+          return null;
+        }),
+      ),
+    );
+    const analytics = results.filter((performance) => performance !== null);
 
     res
       .status(200)
@@ -53,7 +53,10 @@ export const getTransactions = async (req, res) => {
     }
 
     // Order and pagination
-    sql += ` ORDER BY created_at DESC LIMIT ${parseInt(limit)} OFFSET ${parseInt(offset)}`;
+    // Bound as strings: mysql2 sends JS numbers as DOUBLE, which MySQL
+    // rejects for LIMIT/OFFSET in prepared statements
+    sql += " ORDER BY created_at DESC LIMIT ? OFFSET ?";
+    params.push(String(parseInt(limit) || 100), String(parseInt(offset) || 0));
 
     const [rows] = await req.db.execute(sql, params);
 
@@ -1,5 +1,12 @@
 import { createApiResponse, createApiError } from "../../shared/api.js";
 
+// Read-back of updated stock exists only for debug output
+const VERIFY_STOCK_UPDATES = process.env.NODE_ENV === "development";
+
+// Step-by-step stock update tracing, development only. Callers pass printf
+// style arguments so nothing is formatted when tracing is off
+const traceStockUpdate = VERIFY_STOCK_UPDATES ? console.log : () => {};
+
 // Get all transactions with filtering
 export const getTransactions = async (req, res) => {
   try {
@@ -207,8 +214,12 @@ export const createTransaction = async (req, res) => {
 
     // Update product inventory if product exists
     if (productId) {
-      console.log(
-        `Updating inventory for productId: ${productId}, storeId: ${storeId}, type: ${type}, quantity: ${quantity}`,
+      traceStockUpdate(
+        "Updating inventory for productId: %s, storeId: %s, type: %s, quantity: %s",
+        productId,
+        storeId,
+        type,
+        quantity,
       );
 
       // productId is now the database ID from frontend
@@ -217,15 +228,20 @@ export const createTransaction = async (req, res) => {
         [productId, storeId],
       );
 
-      console.log(
-        `Found ${productRows.length} matching products for ID ${productId} in store ${storeId}`,
+      traceStockUpdate(
+        "Found %d matching products for ID %s in store %s",
+        productRows.length,
+        productId,
+        storeId,
       );
 
       if (productRows.length > 0) {
         const product = productRows[0];
         const currentQuantity = product.quantity;
-        console.log(
-          `Current product "${product.name}" quantity: ${currentQuantity}`,
+        traceStockUpdate(
+          'Current product "%s" quantity: %s',
+          product.name,
+          currentQuantity,
         );
 
         let stockChange = 0;
@@ -244,8 +260,11 @@ export const createTransaction = async (req, res) => {
             break;
         }
 
-        console.log(
-          `Applying stock change: ${stockChange} to product ${product.id} in store ${storeId}`,
+        traceStockUpdate(
+          "Applying stock change: %d to product %s in store %s",
+          stockChange,
+          product.id,
+          storeId,
         );
 
         // Update source store stock using exact database ID and store ID
@@ -254,25 +273,32 @@ export const createTransaction = async (req, res) => {
           [stockChange, product.id, storeId],
         );
 
-        console.log(
-          `Product update result: affected rows = ${updateResult.affectedRows}`,
+        traceStockUpdate(
+          "Product update result: affected rows = %d",
+          updateResult.affectedRows,
         );
 
         // Verify the update
-        const [verifyRows] = await req.db.execute(
-          "SELECT quantity FROM products WHERE id = ? AND store_id = ?",
-          [product.id, storeId],
-        );
-
-        if (verifyRows.length > 0) {
-          console.log(
-            `Product quantity after update: ${verifyRows[0].quantity}`,
+        if (VERIFY_STOCK_UPDATES) {
+          const [verifyRows] = await req.db.execute(
+            "SELECT quantity FROM products WHERE id = ? AND store_id = ?",
+            [product.id, storeId],
           );
+
+          if (verifyRows.length > 0) {
+            traceStockUpdate(
+              "Product quantity after update: %s",
+              verifyRows[0].quantity,
+            );
+          }
         }
 
         // If transfer, update destination store stock
         if (type.toLowerCase() === "transfer" && transferToStoreId) {
-          console.log(`Processing transfer to store ${transferToStoreId}`);
+          traceStockUpdate(
+            "Processing transfer to store %s",
+            transferToStoreId,
+          );
 
           // For transfers, we need to find the corresponding product in the destination store
           // This assumes products have the same name/category across stores
@@ -281,14 +307,16 @@ export const createTransaction = async (req, res) => {
             [productName, category, transferToStoreId],
           );
 
-          console.log(
-            `Found ${destProductRows.length} matching destination products`,
+          traceStockUpdate(
+            "Found %d matching destination products",
+            destProductRows.length,
           );
 
           if (destProductRows.length > 0) {
             const destProduct = destProductRows[0];
-            console.log(
-              `Destination product current quantity: ${destProduct.quantity}`,
+            traceStockUpdate(
+              "Destination product current quantity: %s",
+              destProduct.quantity,
             );
 
             const [destUpdateResult] = await req.db.execute(
@@ -296,8 +324,9 @@ export const createTransaction = async (req, res) => {
               [Math.abs(quantity), destProduct.id, transferToStoreId],
             );
 
-            console.log(
-              `Destination update result: affected rows = ${destUpdateResult.affectedRows}`,
+            traceStockUpdate(
+              "Destination update result: affected rows = %d",
+              destUpdateResult.affectedRows,
             );
           } else {
             console.warn(
@@ -1,8 +1,22 @@
 import { query } from "../db/sqlite.js";
 
+// Set once the analytics tables exist, so later calls skip the DDL entirely
+let tablesReady = null;
+
 export class ProductAnalyticsService {
   // Initialize analytics tables (call this on app startup)
   static async initializeTables() {
+    if (!tablesReady) {
+      tablesReady = ProductAnalyticsService.createTables().then((created) => {
+        // Let the next call retry if the DDL failed
+        if (!created) tablesReady = null;
+        return created;
+      });
+    }
+    return tablesReady;
+  }
+
+  static async createTables() {
     try {
       // Basic analytics tables
       await query(`
@@ -69,8 +83,10 @@ export class ProductAnalyticsService {
       `);
 
       console.log("✅ Product analytics tables initialized");
+      return true;
     } catch (error) {
       console.error("❌ Failed to initialize analytics tables:", error);
+      return false;
     }
   }
 
@@ -156,84 +172,111 @@ export class ProductAnalyticsService {
     }
   }
 
+  // Daily sales over the last 90 days for several products, keyed by
+  // product id, fetched in one grouped query
+  static async getDailySalesHistory(productIds, storeId) {
+    const history = new Map();
+    if (productIds.length === 0) return history;
+
+    const startDate = new Date();
+    startDate.setDate(startDate.getDate() - 90);
+
+    const [rows] = await query(
+      `
+      SELECT 
+        product_id,
+        DATE(created_at) as sale_date,
+        SUM(quantity) as daily_sales
+      FROM inventory_transactions 
+      WHERE product_id IN (${productIds.map(() => "?").join(", ")})
+        AND store_id = ? 
+        AND transaction_type = 'Sale'
+        AND datetime(created_at) >= datetime(?)
+      GROUP BY product_id, DATE(created_at)
+      ORDER BY product_id, sale_date
+      `,
+      [...productIds, storeId, startDate.toISOString()],
+    );
+
+    for (const row of rows) {
+      const key = String(row.product_id);
+      if (!history.has(key)) history.set(key, []);
+      history.get(key).push(row.daily_sales);
+    }
+
+    return history;
+  }
+
   // Generate demand forecast using multiple models
   static async generateDemandForecast(productId, storeId, forecastDays = 30) {
     try {
       // Get historical sales data (last 90 days)
-      const startDate = new Date();
-      startDate.setDate(startDate.getDate() - 90);
-
-      const [historicalData] = await query(
-        `
-        SELECT 
-          DATE(created_at) as sale_date,
-          SUM(quantity) as daily_sales
-        FROM inventory_transactions 
-        WHERE product_id = ? 
-          AND store_id = ? 
-          AND transaction_type = 'Sale'
-          AND datetime(created_at) >= datetime(?)
-        GROUP BY DATE(created_at)
-        ORDER BY sale_date
-        `,
-        [productId, storeId, startDate.toISOString()],
-      );
-
-      if (historicalData.length < 7) {
-        throw new Error("Insufficient historical data for forecasting");
-      }
-
-      const salesData = historicalData.map((row) => row.daily_sales);
-      const avgDailySales =
-        salesData.reduce((a, b) => a + b, 0) / salesData.length;
-
-      // Simple linear trend
-      const linearForecast = avgDailySales * forecastDays;
-
-      // Seasonal forecast (basic seasonality detection)
-      const seasonalMultiplier = this.calculateSeasonalIndex(salesData);
-      const seasonalForecast = linearForecast * seasonalMultiplier;
-
-      // ARIMA-like forecast (simplified moving average with trend)
-      const arimaForecast = this.simpleARIMAForecast(salesData, forecastDays);
-
-      // LSTM-like forecast (pattern-based forecast)
-      const lstmForecast = this.simpleLSTMForecast(salesData, forecastDays);
+      const history = await this.getDailySalesHistory([productId], storeId);
 
-      // Ensemble forecast (weighted average)
-      const ensembleForecast =
-        linearForecast * 0.25 +
-        seasonalForecast * 0.25 +
-        arimaForecast * 0.25 +
-        lstmForecast * 0.25;
-
-      // Confidence intervals (±20% for simplicity)
-      const confidence = ensembleForecast * 0.2;
-
-      return {
+      return this.forecastFromSalesData(
         productId,
         storeId,
-        forecastPeriod: forecastDays,
-        linearForecast: parseFloat(linearForecast.toFixed(2)),
-        seasonalForecast: parseFloat(seasonalForecast.toFixed(2)),
-        arimaForecast: parseFloat(arimaForecast.toFixed(2)),
-        lstmForecast: parseFloat(lstmForecast.toFixed(2)),
-        ensembleForecast: parseFloat(ensembleForecast.toFixed(2)),
-        confidenceIntervalLower: parseFloat(
-          (ensembleForecast - confidence).toFixed(2),
-        ),
-        confidenceIntervalUpper: parseFloat(
-          (ensembleForecast + confidence).toFixed(2),
-        ),
-        forecastAccuracyScore: 85.0, // Mock accuracy score
-        historicalDataPoints: salesData.length,
-      };
+        history.get(String(productId)) || [],
+        forecastDays,
+      );
     } catch (error) {
       console.error("Error generating demand forecast:", error);
       throw error;
     }
   }
 
+  // Run the forecast models over an already-fetched daily sales series
+  static forecastFromSalesData(productId, storeId, salesData, forecastDays) {
+    if (salesData.length < 7) {
+      throw new Error("Insufficient historical data for forecasting");
+    }
+
+    const avgDailySales =
+      salesData.reduce((a, b) => a + b, 0) / salesData.length;
+
+    // Simple linear trend
+    const linearForecast = avgDailySales * forecastDays;
+
+    // Seasonal forecast (basic seasonality detection)
+    const seasonalMultiplier = this.calculateSeasonalIndex(salesData);
+    const seasonalForecast = linearForecast * seasonalMultiplier;
+
+    // ARIMA-like forecast (simplified moving average with trend)
+    const arimaForecast = this.simpleARIMAForecast(salesData, forecastDays);
+
+    // LSTM-like forecast (pattern-based forecast)
+    const lstmForecast = this.simpleLSTMForecast(salesData, forecastDays);
+
+    // Ensemble forecast (weighted average)
+    const ensembleForecast =
+      linearForecast * 0.25 +
+      seasonalForecast * 0.25 +
+      arimaForecast * 0.25 +
+      lstmForecast * 0.25;
+
+    // Confidence intervals (±20% for simplicity)
+    const confidence = ensembleForecast * 0.2;
+
+    return {
+      productId,
+      storeId,
+      forecastPeriod: forecastDays,
+      linearForecast: parseFloat(linearForecast.toFixed(2)),
+      seasonalForecast: parseFloat(seasonalForecast.toFixed(2)),
+      arimaForecast: parseFloat(arimaForecast.toFixed(2)),
+      lstmForecast: parseFloat(lstmForecast.toFixed(2)),
+      ensembleForecast: parseFloat(ensembleForecast.toFixed(2)),
+      confidenceIntervalLower: parseFloat(
+        (ensembleForecast - confidence).toFixed(2),
+      ),
+      confidenceIntervalUpper: parseFloat(
+        (ensembleForecast + confidence).toFixed(2),
+      ),
+      forecastAccuracyScore: 85.0, // Mock accuracy score
+      historicalDataPoints: salesData.length,
+    };
+  }
+
   // Helper method to calculate seasonal index
   static calculateSeasonalIndex(salesData) {
     if (salesData.length < 14) return 1.0;
@@ -270,15 +313,16 @@ export class ProductAnalyticsService {
     if (salesData.length < 7)
       return salesData[salesData.length - 1] * forecastDays;
 
-    // Look for weekly patterns
-    const weeklyPattern = [];
-    for (let i = 0; i < 7; i++) {
-      const dayValues = salesData.filter((_, index) => index % 7 === i);
-      weeklyPattern[i] =
-        dayValues.length > 0
-          ? dayValues.reduce((a, b) => a + b, 0) / dayValues.length
-          : 0;
+    // Look for weekly patterns; one pass buckets every value by weekday
+    const daySums = new Array(7).fill(0);
+    const dayCounts = new Array(7).fill(0);
+    for (let index = 0; index < salesData.length; index++) {
+      daySums[index % 7] += salesData[index];
+      dayCounts[index % 7]++;
     }
+    const weeklyPattern = daySums.map((sum, i) =>
+      dayCounts[i] > 0 ? sum / dayCounts[i] : 0,
+    );
 
     let totalForecast = 0;
     for (let day = 0; day < forecastDays; day++) {
@@ -307,14 +351,21 @@ export class ProductAnalyticsService {
         [storeId],
       );
 
+      // One grouped query for every candidate's history instead of one per product
+      const history = await this.getDailySalesHistory(
+        products.map((product) => product.product_id),
+        storeId,
+      );
+
       const recommendations = [];
 
       for (const product of products) {
         try {
           // Get demand forecast for next 14 days
-          const forecast = await this.generateDemandForecast(
+          const forecast = this.forecastFromSalesData(
             product.product_id,
             storeId,
+            history.get(String(product.product_id)) || [],
             14,
           );
 
@@ -378,6 +429,8 @@ export class ProductAnalyticsService {
   // Get analytics dashboard data
   static async getAnalyticsDashboard(storeId, days = 30) {
     try {
+      const sinceModifier = `-${days} days`;
+
       // Get top performing products
       const [topProducts] = await query(
         `
@@ -390,12 +443,12 @@ export class ProductAnalyticsService {
         FROM inventory_transactions it
         WHERE it.store_id = ? 
           AND it.transaction_type = 'Sale'
-          AND datetime(it.created_at) >= datetime(date('now', '-${days} days'))
+          AND datetime(it.created_at) >= datetime(date('now', ?))
         GROUP BY it.product_id, it.product_name
         ORDER BY total_revenue DESC
         LIMIT 10
         `,
-        [storeId],
+        [storeId, sinceModifier],
       );
 
       // Get category performance
@@ -409,11 +462,11 @@ export class ProductAnalyticsService {
         FROM inventory_transactions it
         WHERE it.store_id = ? 
           AND it.transaction_type = 'Sale'
-          AND datetime(it.created_at) >= datetime(date('now', '-${days} days'))
+          AND datetime(it.created_at) >= datetime(date('now', ?))
         GROUP BY it.category
         ORDER BY total_revenue DESC
         `,
-        [storeId],
+        [storeId, sinceModifier],
       );
 
       // Get inventory alerts